@@ -0,0 +1,22 @@
+"""
+Shared Physical Constants
+
+Single source of truth for the constants used across the framework
+modules, so every module (and any JIT compiler freezing module globals)
+sees the same immutable values.
+
+CITATIONS:
+- Melvin Vopson: Mass-energy-information equivalence principle
+- CODATA 2018: Recommended values of the fundamental physical constants
+
+Provenance: Open Science Initiative
+License: Open source for educational and research purposes
+"""
+
+C = 299792458.0  # Speed of light (m/s)
+G = 6.67430e-11  # Gravitational constant (m³/kg·s²)
+H_BAR = 1.054571817e-34  # Reduced Planck constant (J·s)
+K_B = 1.380649e-23  # Boltzmann constant (J/K)
+L_PLANCK = 1.616255e-35  # Planck length (m)
+VOPSON_CONSTANT = 3.19e-38  # Vopson's mass-per-bit constant (kg/bit)
+LN2 = 0.6931471805599453  # ln 2, nats per bit
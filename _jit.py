@@ -0,0 +1,24 @@
+"""
+Optional Numba Support
+
+Shared shim for the framework's compiled kernels. When Numba is installed,
+``njit`` and ``prange`` are the real Numba objects; otherwise ``njit`` is a
+no-op decorator and ``prange`` is ``range``, so every module still runs as
+plain Python/NumPy.
+
+Provenance: Open Science Initiative
+License: Open source for educational and research purposes
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for ``numba.njit``: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
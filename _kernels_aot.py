@@ -0,0 +1,64 @@
+"""
+Ahead-of-Time Build of the Entropic Gravity Kernels
+
+Compiles the scalar closed forms from `entropic_gravity` into a native
+extension module, ``physics_kernels``, using Numba's AOT compiler. When
+the extension is importable, `entropic_gravity` routes all-scalar calls
+to it, so the first call pays neither JIT compilation nor cache loading.
+
+Build once per machine/interpreter (requires Numba and a C compiler):
+
+    python _kernels_aot.py
+
+The resulting shared library is a local build artifact and is not
+committed; without it the JIT/NumPy paths are used unchanged.
+
+The exports follow the same zero-distance contract as the JIT and NumPy
+paths: divisions go through ``np.true_divide``, so r = 0 yields inf
+instead of raising ZeroDivisionError.
+
+Provenance: Open Science Initiative
+License: Open source for educational and research purposes
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+from _constants import G, VOPSON_CONSTANT
+from entropic_gravity import _BEKENSTEIN_COEFF, _TWO_PI_C_OVER_HBAR
+
+cc = CC('physics_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('entropic_force', 'f8(f8,f8,f8)')
+def entropic_force(mass_source, mass_test, distance):
+    return np.true_divide(G * mass_source * mass_test, distance * distance)
+
+
+@cc.export('holographic_screen_entropy', 'f8(f8,f8)')
+def holographic_screen_entropy(radius, mass_enclosed):
+    return _TWO_PI_C_OVER_HBAR * mass_enclosed * radius
+
+
+@cc.export('information_bits_on_screen', 'f8(f8,f8)')
+def information_bits_on_screen(radius, mass):
+    return _TWO_PI_C_OVER_HBAR * mass * radius
+
+
+@cc.export('bekenstein_bound', 'f8(f8,f8)')
+def bekenstein_bound(energy, radius):
+    return _BEKENSTEIN_COEFF * radius * energy
+
+
+@cc.export('information_acceleration', 'f8(f8,f8,f8)')
+def information_acceleration(mass_source, distance, information_bits):
+    inv_r2 = np.true_divide(1.0, distance * distance)
+    return G * (mass_source + information_bits * VOPSON_CONSTANT) * inv_r2
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built physics_kernels in {cc.output_dir}")
@@ -4,6 +4,13 @@ Entropic Gravity Module
 Implements Erik Verlinde's entropic gravity framework, showing how
 gravitational phenomena emerge from information and thermodynamics.
 
+Every closed-form helper accepts scalars or NumPy arrays, so parameter
+sweeps run as one vectorized call instead of a Python loop.
+
+Division by a zero distance follows NumPy semantics on every install
+(AOT build, Numba JIT or plain NumPy): the result is inf (nan for 0/0),
+never a ZeroDivisionError.
+
 CITATIONS:
 - Trent Slade: Informational Mass Gravity Framework
 - Gary Vetro: Informational Mass Gravity Framework
@@ -17,18 +24,68 @@ Ethics: This code implements theoretical models of emergent gravity.
         established gravitational theories.
 """
 
+import functools
+import math
+
 import numpy as np
+from numpy.typing import ArrayLike
 from typing import Tuple, Optional
 
+from _constants import C, G, H_BAR, K_B, LN2, VOPSON_CONSTANT
+from _jit import NUMBA_AVAILABLE, njit, prange
+
+try:
+    # Optional native build of the scalar kernels (see _kernels_aot.py)
+    import physics_kernels as _aot
+except ImportError:
+    _aot = None
+
+# Derived coefficients, folded once at import rather than on every call
+_TWO_PI_C_OVER_HBAR = 2 * math.pi * C / H_BAR  # Screen bits per kg·m
+_BEKENSTEIN_COEFF = 2 * math.pi / (H_BAR * C * LN2)  # Bits per J·m
+_TWO_G_OVER_C2 = 2 * G / (C * C)  # Schwarzschild radius per kg (m/kg)
+_HBAR_OVER_C = H_BAR / C  # Compton wavelength × mass (kg·m)
+_UNRUH_COEFF = H_BAR * G / (2 * math.pi * K_B * C)  # Screen temperature × r² / M (K·m²/kg)
+_KM_PER_MPC_INV = 1000 / 3.086e22  # km/s/Mpc → 1/s
+# c² H_SI² / (8πG) with H_SI = H · _KM_PER_MPC_INV folded into one factor
+_DE_HUBBLE_COEFF = C * C * _KM_PER_MPC_INV * _KM_PER_MPC_INV / (8 * math.pi * G)
+
+
+def _aot_scalar_path(nargs: int):
+    """
+    Route all-scalar calls with `nargs` positional arguments to the
+    ahead-of-time compiled kernel of the same name, when it has been built.
+    
+    Array or keyword calls, and every call when ``physics_kernels`` is
+    absent, go to the decorated JIT/NumPy function unchanged.
+    """
+    def decorate(func):
+        aot_func = getattr(_aot, func.__name__, None)
+        if aot_func is None:
+            return func
+        
+        @functools.wraps(func)
+        def dispatch(*args, **kwargs):
+            if not kwargs and len(args) == nargs and all(np.ndim(a) == 0 for a in args):
+                return aot_func(*args)
+            return func(*args, **kwargs)
+        return dispatch
+    return decorate
+
+
+def _as_f8(value: ArrayLike):
+    """Kernel argument in float64: a Python float for scalars, an ndarray otherwise."""
+    return float(value) if np.ndim(value) == 0 else np.asarray(value, dtype=np.float64)
+
 
-# Physical constants
-C = 299792458  # Speed of light (m/s)
-G = 6.67430e-11  # Gravitational constant (m³/kg·s²)
-H_BAR = 1.054571817e-34  # Reduced Planck constant (J·s)
-K_B = 1.380649e-23  # Boltzmann constant (J/K)
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _screen_entropy(radius, mass_enclosed):
+    """Screen entropy 2π M c R / ℏ in k_B; float64 scalars compiled at import."""
+    return _TWO_PI_C_OVER_HBAR * mass_enclosed * radius
 
 
-def holographic_screen_entropy(radius: float, mass_enclosed: float) -> float:
+@_aot_scalar_path(2)
+def holographic_screen_entropy(radius: ArrayLike, mass_enclosed: ArrayLike) -> ArrayLike:
     """
     Calculate entropy on holographic screen (Verlinde).
     
@@ -44,14 +101,24 @@ def holographic_screen_entropy(radius: float, mass_enclosed: float) -> float:
     Returns:
         Entropy in units of k_B
         
+    Note: With Numba, the all-scalar kernel is compiled at import. Arrays
+          and lists of any shape and numeric dtype are converted to
+          float64 and compiled lazily (and cached) per shape.
+        
     References:
         - Verlinde, E. (2011). On the origin of gravity and the laws of Newton
         - Slade, T. & Vetro, G.: Informational mass interpretation
     """
-    return (2 * np.pi * mass_enclosed * C * radius) / H_BAR
+    return _screen_entropy(_as_f8(radius), _as_f8(mass_enclosed))
+
 
+@njit(cache=True, error_model='numpy')
+def _unruh_temp(mass, r):
+    """Unruh temperature T = ℏ G M / (2π k_B c r²), compiled for any shape and dtype."""
+    return _UNRUH_COEFF * mass / (r * r)
 
-def temperature_holographic_screen(radius: float) -> float:
+
+def temperature_holographic_screen(radius: ArrayLike, mass: ArrayLike) -> ArrayLike:
     """
     Calculate temperature of holographic screen (Unruh temperature).
     
@@ -61,28 +128,41 @@ def temperature_holographic_screen(radius: float) -> float:
     
     Args:
         radius: Radius from mass (m)
+        mass: Mass enclosed by the screen (kg)
         
     Returns:
         Temperature in Kelvin
         
+    Warning: `mass` is now required. Earlier versions took only the radius
+             and silently assumed one solar mass (1.989e30 kg).
+        
     References:
         - Unruh, W. G. (1976). Acceleration radiation
         - Verlinde, E. (2011). Temperature of holographic screen
     """
-    # For a test particle, use Unruh temperature with acceleration
-    # This is a simplified version; full calculation needs mass
-    # Using typical acceleration for illustration
-    acceleration = G * 1.989e30 / (radius ** 2)  # Using solar mass
-    temperature = (H_BAR * acceleration) / (2 * np.pi * K_B * C)
-    return temperature
+    return _unruh_temp(np.asarray(mass), np.asarray(radius))
 
 
+@njit(cache=True, error_model='numpy')
+def _newton_force(mass_source, mass_test, distance):
+    """Force G M m / r²; float64 scalars compiled at import."""
+    # np.true_divide keeps r = 0 at inf for plain Python floats as well.
+    return np.true_divide(G * mass_source * mass_test, distance * distance)
+
+
+if NUMBA_AVAILABLE:
+    # Eager scalar signatures; every other input compiles on first use
+    _screen_entropy.compile('f8(f8,f8)')
+    _newton_force.compile('f8(f8,f8,f8)')
+
+
+@_aot_scalar_path(3)
 def entropic_force(
-    mass_source: float,
-    mass_test: float,
-    distance: float,
-    temperature: Optional[float] = None
-) -> float:
+    mass_source: ArrayLike,
+    mass_test: ArrayLike,
+    distance: ArrayLike,
+    temperature: Optional[ArrayLike] = None
+) -> ArrayLike:
     """
     Calculate entropic force between masses (Verlinde).
     
@@ -94,36 +174,67 @@ def entropic_force(
         mass_source: Source mass (kg)
         mass_test: Test mass (kg)
         distance: Distance between masses (m)
-        temperature: Optional temperature (K), computed if not provided
+        temperature: Screen temperature (K). Accepted for compatibility only;
+            T cancels in T dS/dx, see `temperature_holographic_screen`
         
     Returns:
         Force in Newtons
         
+    Note: With Numba, the all-scalar kernel is compiled at import. Arrays
+          and lists of any shape and numeric dtype are converted to
+          float64 and compiled lazily (and cached) per shape.
+        
     References:
         - Verlinde, E. (2011). Entropic origin of Newton's law
         - Connection to Slade-Vetro informational mass framework
     """
-    if temperature is None:
-        # Use Unruh temperature
-        acceleration = G * mass_source / (distance ** 2)
-        temperature = (H_BAR * acceleration) / (2 * np.pi * K_B * C)
-    
-    # Number of bits on screen
-    N = (2 * np.pi * mass_source * C * distance) / H_BAR
-    
-    # Change in bits per unit distance
-    dN_dx = (2 * np.pi * mass_source * C) / H_BAR
+    # T dS/dx with dS/dx = 2π k_B m c / ℏ and the Unruh temperature of the
+    # screen: every factor except G M m / r² cancels, so no T is needed.
+    return _newton_force(_as_f8(mass_source), _as_f8(mass_test), _as_f8(distance))
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def entropic_force_batch(
+    masses_source: np.ndarray,
+    masses_test: np.ndarray,
+    distances: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate entropic forces for N independent mass pairs in parallel.
     
-    # Entropic force
-    force = K_B * temperature * dN_dx * (mass_test * C ** 2) / (K_B * temperature)
+    F_i = G M_i m_i / r_i²
     
-    # This simplifies to Newton's law
-    force_newton = G * mass_source * mass_test / (distance ** 2)
+    Batched counterpart of `entropic_force` for parameter sweeps; each
+    element is independent, so the loop is split across threads.
     
-    return force_newton
+    Args:
+        masses_source: Source masses (kg), 1-D float array
+        masses_test: Test masses (kg), same length as masses_source
+        distances: Distances (m), same length as masses_source
+        
+    Returns:
+        Array of forces in Newtons
+        
+    Raises:
+        ValueError: If the three arrays differ in length
+    """
+    n = masses_source.shape[0]
+    if masses_test.shape[0] != n or distances.shape[0] != n:
+        raise ValueError("masses_source, masses_test and distances must have the same length")
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = G * masses_source[i] * masses_test[i] / (distances[i] * distances[i])
+    return out
+
+
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _screen_bits(radius, mass):
+    """Screen bits N = 2π M c R / ℏ, compiled for any shape and dtype."""
+    return _TWO_PI_C_OVER_HBAR * mass * radius
 
 
-def information_bits_on_screen(radius: float, mass: float) -> float:
+@_aot_scalar_path(2)
+def information_bits_on_screen(radius: ArrayLike, mass: ArrayLike) -> ArrayLike:
     """
     Calculate number of information bits on holographic screen.
     
@@ -139,10 +250,10 @@ def information_bits_on_screen(radius: float, mass: float) -> float:
     Note: Connects Verlinde's framework to Vopson's information principle
           and Slade-Vetro's informational mass concept.
     """
-    return (2 * np.pi * mass * C * radius) / H_BAR
+    return _screen_bits(np.asarray(radius), np.asarray(mass))
 
 
-def compton_wavelength(mass: float) -> float:
+def compton_wavelength(mass: ArrayLike) -> ArrayLike:
     """
     Calculate Compton wavelength of a mass.
     
@@ -157,10 +268,10 @@ def compton_wavelength(mass: float) -> float:
     Returns:
         Compton wavelength (m)
     """
-    return H_BAR / (mass * C)
+    return np.true_divide(_HBAR_OVER_C, mass)
 
 
-def schwarzschild_radius(mass: float) -> float:
+def schwarzschild_radius(mass: ArrayLike) -> ArrayLike:
     """
     Calculate Schwarzschild radius.
     
@@ -172,10 +283,17 @@ def schwarzschild_radius(mass: float) -> float:
     Returns:
         Schwarzschild radius (m)
     """
-    return 2 * G * mass / (C ** 2)
+    return np.multiply(mass, _TWO_G_OVER_C2)
 
 
-def bekenstein_bound(energy: float, radius: float) -> float:
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _bekenstein(energy, radius):
+    """Bekenstein bound 2π R E / (ℏ c ln2) in bits, compiled for any shape and dtype."""
+    return _BEKENSTEIN_COEFF * radius * energy
+
+
+@_aot_scalar_path(2)
+def bekenstein_bound(energy: ArrayLike, radius: ArrayLike) -> ArrayLike:
     """
     Calculate Bekenstein bound on information.
     
@@ -196,10 +314,44 @@ def bekenstein_bound(energy: float, radius: float) -> float:
         - Verlinde, E. (2011): Applied to entropic gravity
         - Vopson, M. M.: Information-mass equivalence
     """
-    return (2 * np.pi * radius * energy) / (H_BAR * C * np.log(2))
+    return _bekenstein(np.asarray(energy), np.asarray(radius))
 
 
-def emergent_spacetime_dimension(information_bits: float, volume: float) -> float:
+@njit(parallel=True, fastmath=True, cache=True)
+def bekenstein_bound_batch(energies: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Calculate the Bekenstein bound for N regions in parallel.
+    
+    I_i ≤ 2π R_i E_i / (ℏ c ln2)
+    
+    Args:
+        energies: Total energies (J), 1-D float array
+        radii: Region radii (m), same length as energies
+        
+    Returns:
+        Array of maximum information contents in bits
+        
+    Raises:
+        ValueError: If energies and radii differ in length
+    """
+    n = energies.shape[0]
+    if radii.shape[0] != n:
+        raise ValueError("energies and radii must have the same length")
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = _BEKENSTEIN_COEFF * radii[i] * energies[i]
+    return out
+
+
+@njit(cache=True)
+def _emergent_dimension_scalar(rho_info: float) -> float:
+    """Scalar kernel of `emergent_spacetime_dimension`; min/max lower to minsd/maxsd."""
+    eff_dim = 3.0 + (math.log10(max(rho_info, 1e-300)) - 30.0) / 10
+    eff_dim = eff_dim if rho_info > 0 else 3.0
+    return min(11.0, max(1.0, eff_dim))
+
+
+def emergent_spacetime_dimension(information_bits: ArrayLike, volume: ArrayLike) -> ArrayLike:
     """
     Calculate effective spacetime dimension from information density.
     
@@ -211,27 +363,34 @@ def emergent_spacetime_dimension(information_bits: float, volume: float) -> floa
         volume: Volume in m³
         
     Returns:
-        Effective dimension (dimensionless)
+        Effective dimension (dimensionless), clamped to [1, 11]
         
     Note: This is a theoretical exploration connecting information
           density to emergent geometry (Slade-Vetro framework).
     """
     # Information density
-    rho_info = information_bits / volume
+    rho_info = np.true_divide(information_bits, volume)
     
     # Dimensional estimate based on holographic scaling
     # S ~ A^((D-2)/(D-1)) for D-dimensional space
     # This is simplified; full theory under development
-    
-    # Using logarithmic scaling as proxy
-    if rho_info > 0:
-        # Effective dimension scales with log of density
-        eff_dim = 3 + np.log10(rho_info / 1e30) / 10
-        return max(1, min(11, eff_dim))  # Clamp to reasonable range
-    return 3
+    if np.ndim(rho_info) == 0:
+        return _emergent_dimension_scalar(float(rho_info))
+    
+    # Effective dimension scales with log10(rho / 1e30), written as
+    # log10(rho) - 30 so the 1e-300 floor cannot underflow; non-positive
+    # densities fall back to 3 without a per-element branch. One buffer is
+    # reused for every step instead of allocating a temporary per operator.
+    eff_dim = np.maximum(rho_info, 1e-300)
+    np.log10(eff_dim, out=eff_dim)
+    eff_dim -= 30
+    eff_dim /= 10
+    eff_dim += 3
+    np.copyto(eff_dim, 3.0, where=~(rho_info > 0))
+    return np.clip(eff_dim, 1, 11, out=eff_dim)  # Clamp to reasonable range
 
 
-def dark_energy_entropic(hubble_constant: float) -> float:
+def dark_energy_entropic(hubble_constant: ArrayLike) -> ArrayLike:
     """
     Estimate dark energy density from entropic arguments (Verlinde 2016).
     
@@ -248,21 +407,28 @@ def dark_energy_entropic(hubble_constant: float) -> float:
         - Verlinde, E. (2016). Emergent gravity and dark universe
         - Explores apparent dark energy without cosmological constant
     """
-    # Convert Hubble to SI units
-    H_SI = hubble_constant * 1000 / (3.086e22)  # 1/s
-    
     # Verlinde's prediction (simplified)
-    # ρ_DE ~ (c² H²) / (8π G)
-    rho_de = (C ** 2 * H_SI ** 2) / (8 * np.pi * G)
-    
-    return rho_de
+    # ρ_DE ~ (c² H²) / (8π G), with the km/s/Mpc → 1/s conversion of H
+    # folded into the coefficient
+    hubble_constant = np.asarray(hubble_constant)
+    return _DE_HUBBLE_COEFF * hubble_constant * hubble_constant
 
 
+@njit(cache=True, error_model='numpy')
+def _info_acceleration(mass_source, distance, information_bits):
+    """Acceleration G (M + N m_bit) / r², compiled for any shape and dtype."""
+    # Gravitational plus information-mass (Vopson + Slade-Vetro) terms share
+    # the same G / r² factor
+    inv_r2 = 1.0 / (distance * distance)
+    return G * (mass_source + information_bits * VOPSON_CONSTANT) * inv_r2
+
+
+@_aot_scalar_path(3)
 def information_acceleration(
-    mass_source: float,
-    distance: float,
-    information_bits: float
-) -> float:
+    mass_source: ArrayLike,
+    distance: ArrayLike,
+    information_bits: ArrayLike
+) -> ArrayLike:
     """
     Calculate acceleration incorporating information content.
     
@@ -279,56 +445,91 @@ def information_acceleration(
         
     Note: This combines gravitational and informational contributions.
     """
-    # Standard gravitational acceleration
-    a_grav = G * mass_source / (distance ** 2)
-    
-    # Information mass contribution (Vopson + Slade-Vetro)
-    VOPSON_CONSTANT = 3.19e-38  # kg/bit
-    info_mass = information_bits * VOPSON_CONSTANT
-    a_info = G * info_mass / (distance ** 2)
-    
-    # Total acceleration
-    return a_grav + a_info
+    return _info_acceleration(np.asarray(mass_source), np.asarray(distance),
+                              np.asarray(information_bits))
+
+
+if NUMBA_AVAILABLE:
+    from numba import guvectorize
+    
+    @guvectorize(['void(f8, f8, f8, f8[:])'], '(),(),()->()',
+                 target='parallel', cache=True)
+    def information_acceleration_u(mass_source, distance, information_bits, out):
+        """
+        Broadcasting, multi-threaded ufunc form of `information_acceleration`.
+        
+        Sweeps over (mass_source, distance, information_bits) grids follow
+        NumPy broadcasting rules, with SIMD inner loops spread over cores.
+        
+        Args:
+            mass_source: Source masses (kg)
+            distance: Distances (m)
+            information_bits: Information contents (bits)
+            
+        Returns:
+            Array of accelerations in m/s²
+        """
+        # Same 1/r² factor as _info_acceleration, so both round identically
+        inv_r2 = 1.0 / (distance * distance)
+        out[0] = G * (mass_source + information_bits * VOPSON_CONSTANT) * inv_r2
+else:
+    # Plain NumPy already broadcasts the closed form over its arguments
+    information_acceleration_u = information_acceleration
 
 
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Entropic Gravity Demonstrations")
-    print("Erik Verlinde's Framework")
-    print("Extended by Trent Slade & Gary Vetro")
-    print("Citations: Melvin Vopson")
-    print("=" * 70)
+    import argparse
+    import io
+    import sys
+    
+    parser = argparse.ArgumentParser(description="Entropic gravity demonstrations")
+    parser.add_argument("--quiet", action="store_true",
+                        help="run the calculations without formatting or printing")
+    args = parser.parse_args()
     
+    # Calculations first, so --quiet times only the physics kernels
     # Example 1: Earth-Sun system
-    print("\n1. Earth-Sun System:")
     M_sun = 1.989e30  # kg
     R_earth_sun = 1.496e11  # m (1 AU)
     M_earth = 5.972e24  # kg
-    
     force = entropic_force(M_sun, M_earth, R_earth_sun)
-    print(f"   Entropic force: {force:.6e} N")
-    
     bits_on_screen = information_bits_on_screen(R_earth_sun, M_sun)
-    print(f"   Information bits on screen: {bits_on_screen:.6e} bits")
     
     # Example 2: Black hole
-    print("\n2. Solar Mass Black Hole:")
     r_s = schwarzschild_radius(M_sun)
-    print(f"   Schwarzschild radius: {r_s:.2f} m")
-    
     entropy = holographic_screen_entropy(r_s, M_sun)
-    print(f"   Horizon entropy: {entropy:.6e} k_B")
     
     # Example 3: Bekenstein bound
-    print("\n3. Bekenstein Bound:")
     energy = 1e10  # Joules
     radius = 1.0  # meter
     max_info = bekenstein_bound(energy, radius)
-    print(f"   Maximum information in 1m sphere with {energy:.2e}J:")
-    print(f"   {max_info:.6e} bits")
     
     # Example 4: Dark energy
-    print("\n4. Dark Energy (Verlinde 2016):")
     H0 = 70  # km/s/Mpc
     rho_de = dark_energy_entropic(H0)
-    print(f"   Predicted dark energy density: {rho_de:.6e} J/m³")
+    
+    if not args.quiet:
+        # Format the whole report in memory and write it in one call
+        out = io.StringIO()
+        print("=" * 70, file=out)
+        print("Entropic Gravity Demonstrations", file=out)
+        print("Erik Verlinde's Framework", file=out)
+        print("Extended by Trent Slade & Gary Vetro", file=out)
+        print("Citations: Melvin Vopson", file=out)
+        print("=" * 70, file=out)
+        
+        print("\n1. Earth-Sun System:", file=out)
+        print(f"   Entropic force: {force:.6e} N", file=out)
+        print(f"   Information bits on screen: {bits_on_screen:.6e} bits", file=out)
+        
+        print("\n2. Solar Mass Black Hole:", file=out)
+        print(f"   Schwarzschild radius: {r_s:.2f} m", file=out)
+        print(f"   Horizon entropy: {entropy:.6e} k_B", file=out)
+        
+        print("\n3. Bekenstein Bound:", file=out)
+        print(f"   Maximum information in 1m sphere with {energy:.2e}J:", file=out)
+        print(f"   {max_info:.6e} bits", file=out)
+        
+        print("\n4. Dark Energy (Verlinde 2016):", file=out)
+        print(f"   Predicted dark energy density: {rho_de:.6e} J/m³", file=out)
+        sys.stdout.write(out.getvalue())
@@ -0,0 +1,117 @@
+"""
+Physics Kernel Test Module
+
+Checks the compiled closed-form helpers of `entropic_gravity` and
+`mass_energy_equivalence` against their plain NumPy formulas, so the
+results do not depend on whether Numba is installed.
+
+Provenance: Open Science Initiative
+License: Open source for educational and research purposes
+"""
+import numpy as np
+
+from _constants import G, K_B, VOPSON_CONSTANT
+from entropic_gravity import (
+    _BEKENSTEIN_COEFF,
+    _TWO_PI_C_OVER_HBAR,
+    bekenstein_bound,
+    bekenstein_bound_batch,
+    entropic_force,
+    entropic_force_batch,
+    holographic_screen_entropy,
+    information_acceleration,
+    information_acceleration_u,
+    information_bits_on_screen,
+    temperature_holographic_screen,
+)
+from mass_energy_equivalence import (
+    _SCHWARZSCHILD_S_COEFF,
+    emergent_force_from_entropy_gradient,
+    schwarzschild_information_entropy,
+)
+
+def test_kernels_accept_lists():
+    """
+    Test that the compiled helpers take Python lists like the NumPy formulas.
+   
+    Each call must return an ndarray matching the closed form, with or
+    without Numba.
+    """
+    a = [1.0, 2.0, 4.0]
+    b = [3.0, 5.0, 7.0]
+    x, y = np.asarray(a), np.asarray(b)
+    cases = [
+        (information_bits_on_screen(a, b), _TWO_PI_C_OVER_HBAR * y * x),
+        (bekenstein_bound(a, b), _BEKENSTEIN_COEFF * y * x),
+        (information_acceleration(a, b, a), G * (x + x * VOPSON_CONSTANT) / (y * y)),
+        (schwarzschild_information_entropy(a), _SCHWARZSCHILD_S_COEFF * x * x),
+        (emergent_force_from_entropy_gradient(a, b), y * K_B * x),
+    ]
+    for result, expected in cases:
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+def test_batch_kernels_reject_mismatched_lengths():
+    """
+    Test that the batch kernels refuse inputs of different lengths.
+   
+    The compiled loops index every input up to the length of the first,
+    so a shorter array would otherwise be read past its end.
+    """
+    for call in (lambda: entropic_force_batch(np.ones(3), np.ones(2), np.ones(2)),
+                 lambda: entropic_force_batch(np.ones(3), np.ones(3), np.ones(2)),
+                 lambda: bekenstein_bound_batch(np.ones(4), np.ones(1))):
+        try:
+            call()
+        except ValueError:
+            continue
+        raise AssertionError("mismatched lengths were accepted")
+    np.testing.assert_allclose(entropic_force_batch(np.ones(2), np.ones(2), np.ones(2)),
+                               [G, G], rtol=1e-12)
+
+def test_zero_distance_gives_inf():
+    """
+    Test the shared zero-distance contract of the force and screen helpers.
+   
+    A zero distance must give inf rather than raise, for scalars and
+    arrays, whichever of the AOT, JIT or NumPy paths handles the call.
+    """
+    with np.errstate(divide='ignore'):
+        assert entropic_force(1.0, 1.0, 0.0) == np.inf
+        assert information_acceleration(1.0, 0.0, 0.0) == np.inf
+        assert temperature_holographic_screen(0.0, 1.0) == np.inf
+        assert np.all(entropic_force(1.0, 1.0, np.zeros(2)) == np.inf)
+        assert np.all(entropic_force_batch(np.ones(2), np.ones(2), np.zeros(2)) == np.inf)
+
+def test_eager_kernels_accept_any_numeric_input():
+    """
+    Test the eagerly compiled kernels beyond their float64 scalar signature.
+   
+    Integer, float32 and 2-D arrays, lists, mixed scalar/array arguments
+    and an array temperature must all match the NumPy closed forms.
+    """
+    masses = np.array([[1, 2], [3, 4]])
+    radii = np.array([[2.0, 4.0], [8.0, 16.0]], dtype=np.float32)
+    m, r = masses.astype(np.float64), radii.astype(np.float64)
+    cases = [
+        (holographic_screen_entropy(radii, masses), _TWO_PI_C_OVER_HBAR * m * r),
+        (holographic_screen_entropy(1.0, masses), _TWO_PI_C_OVER_HBAR * m),
+        (holographic_screen_entropy([1.0, 2.0], [3.0, 4.0]),
+         _TWO_PI_C_OVER_HBAR * np.array([3.0, 8.0])),
+        (entropic_force(masses, 1.0, radii), G * m / (r * r)),
+        (entropic_force(m, 2, r, temperature=np.ones(2)), G * m * 2 / (r * r)),
+        (entropic_force(3, 5, 2), G * 15 / 4),
+    ]
+    for result, expected in cases:
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+def test_acceleration_ufunc_matches_kernel():
+    """
+    Test that the broadcasting ufunc rounds exactly like information_acceleration.
+    """
+    rng = np.random.default_rng(0)
+    masses = 10 ** rng.uniform(20, 31, 1000)
+    distances = 10 ** rng.uniform(3, 12, 1000)
+    bits = 10 ** rng.uniform(30, 70, 1000)
+    np.testing.assert_array_equal(information_acceleration_u(masses, distances, bits),
+                                  information_acceleration(masses, distances, bits))
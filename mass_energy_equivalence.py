@@ -4,6 +4,8 @@ Mass-Energy-Information Equivalence Module
 Implements the Vopson mass-energy-information equivalence principle
 and its connection to the Slade-Vetro informational mass framework.
 
+Functions take scalar or array arguments and broadcast elementwise.
+
 CITATIONS:
 - Trent Slade: Informational Mass Gravity Framework
 - Gary Vetro: Informational Mass Gravity Framework  
@@ -17,17 +19,23 @@ Ethics: These calculations explore theoretical relationships between
         within established physics frameworks.
 """
 
+import math
+
 import numpy as np
+from numpy.typing import ArrayLike
 from typing import Tuple, Optional
 
-# Physical constants
-C = 299792458  # Speed of light (m/s)
-H_BAR = 1.054571817e-34  # Reduced Planck constant (J·s)
-K_B = 1.380649e-23  # Boltzmann constant (J/K)
-VOPSON_CONSTANT = 3.19e-38  # Vopson's mass-per-bit constant (kg/bit)
+from _constants import C, G, H_BAR, K_B, L_PLANCK, LN2, VOPSON_CONSTANT
+from _jit import njit, prange
 
+# Derived coefficients, evaluated once at import
+_C_SQUARED = C * C
+_LANDAUER_COEFF = K_B * LN2  # Erasure energy per bit per kelvin (J/K)
+_HOLO_COEFF = 1.0 / (4 * L_PLANCK * L_PLANCK)  # Entropy per m² (k_B/m²)
+_SCHWARZSCHILD_S_COEFF = 4 * math.pi * G / (H_BAR * C)  # Horizon entropy per kg² (k_B/kg²)
 
-def information_mass(bits: float) -> float:
+
+def information_mass(bits: ArrayLike) -> ArrayLike:
     """
     Calculate the mass equivalent of information using Vopson's principle.
     
@@ -45,10 +53,28 @@ def information_mass(bits: float) -> float:
         - Vopson, M. M. (2019). AIP Advances 9, 095206
         - Slade, T. & Vetro, G.: Informational mass framework
     """
-    return bits * VOPSON_CONSTANT
+    return np.multiply(bits, VOPSON_CONSTANT)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def information_mass_batch(bits: np.ndarray) -> np.ndarray:
+    """
+    Calculate Vopson information mass for N bit counts in parallel.
+    
+    Args:
+        bits: Numbers of bits, 1-D float array
+        
+    Returns:
+        Array of masses in kilograms
+    """
+    n = bits.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = bits[i] * VOPSON_CONSTANT
+    return out
 
 
-def landauer_energy(bits: float, temperature: float = 300.0) -> float:
+def landauer_energy(bits: ArrayLike, temperature: ArrayLike = 300.0) -> ArrayLike:
     """
     Calculate minimum energy to erase information (Landauer's principle).
     
@@ -68,10 +94,13 @@ def landauer_energy(bits: float, temperature: float = 300.0) -> float:
         - Landauer, R. (1961). IBM J. Res. Dev.
         - Verlinde, E. (2011). Entropic forces
     """
-    return bits * K_B * temperature * np.log(2)
+    # Single float buffer at the broadcast shape, scaled in place
+    energy = np.multiply(bits, temperature, dtype=np.float64)
+    energy *= _LANDAUER_COEFF
+    return energy
 
 
-def mass_from_energy(energy: float) -> float:
+def mass_from_energy(energy: ArrayLike) -> ArrayLike:
     """
     Calculate mass equivalent from energy using E = mc².
     
@@ -81,10 +110,10 @@ def mass_from_energy(energy: float) -> float:
     Returns:
         Mass in kilograms
     """
-    return energy / (C ** 2)
+    return np.true_divide(energy, _C_SQUARED)
 
 
-def energy_from_mass(mass: float) -> float:
+def energy_from_mass(mass: ArrayLike) -> ArrayLike:
     """
     Calculate energy from mass using E = mc².
     
@@ -94,10 +123,10 @@ def energy_from_mass(mass: float) -> float:
     Returns:
         Energy in Joules
     """
-    return mass * C ** 2
+    return np.multiply(mass, _C_SQUARED)
 
 
-def holographic_entropy_bound(area: float) -> float:
+def holographic_entropy_bound(area: ArrayLike) -> ArrayLike:
     """
     Calculate maximum entropy from holographic bound.
     
@@ -117,11 +146,10 @@ def holographic_entropy_bound(area: float) -> float:
         - Verlinde, E. (2011). Holographic principle in gravity
         - 't Hooft, G. (1993). Dimensional reduction
     """
-    L_PLANCK = 1.616255e-35  # Planck length (m)
-    return area / (4 * L_PLANCK ** 2)
+    return np.multiply(area, _HOLO_COEFF)
 
 
-def holographic_information_density(area: float) -> float:
+def holographic_information_density(area: ArrayLike) -> ArrayLike:
     """
     Calculate information density from holographic principle.
     
@@ -136,15 +164,21 @@ def holographic_information_density(area: float) -> float:
     """
     entropy_kb = holographic_entropy_bound(area)
     # Convert from natural units to bits
-    bits = entropy_kb / np.log(2)
-    return bits / area
+    bits = entropy_kb / LN2
+    return np.true_divide(bits, area)
 
 
-def schwarzschild_information_entropy(mass: float) -> float:
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _schwarzschild_entropy(mass):
+    """Bekenstein-Hawking entropy 4π G M² / (ℏ c) in k_B, compiled for any shape and dtype."""
+    return _SCHWARZSCHILD_S_COEFF * mass * mass
+
+
+def schwarzschild_information_entropy(mass: ArrayLike) -> ArrayLike:
     """
     Calculate the information/entropy of a Schwarzschild black hole.
     
-    S = (k_B * c³ * A) / (4 * G * ℏ)
+    S = (k_B * c³ * A) / (4 * G * ℏ) = 4π k_B G M² / (ℏ c)
     
     Demonstrates the deep connection between gravity, information,
     and entropy central to Verlinde's theory.
@@ -159,21 +193,12 @@ def schwarzschild_information_entropy(mass: float) -> float:
         - Bekenstein, J. & Hawking, S. (1974). Black hole thermodynamics
         - Verlinde, E. (2011). Entropic origin of gravity
     """
-    G = 6.67430e-11  # Gravitational constant (m³/kg·s²)
-    
-    # Schwarzschild radius
-    r_s = 2 * G * mass / (C ** 2)
-    
-    # Event horizon area
-    area = 4 * np.pi * r_s ** 2
-    
-    # Bekenstein-Hawking entropy
-    entropy = (K_B * C ** 3 * area) / (4 * G * H_BAR)
-    
-    return entropy / K_B  # Return in units of k_B
+    # Bekenstein-Hawking entropy with A = 4π r_s², r_s = 2GM/c² substituted,
+    # in units of k_B
+    return _schwarzschild_entropy(np.asarray(mass))
 
 
-def information_density_to_mass_density(info_bits_per_m3: float) -> float:
+def information_density_to_mass_density(info_bits_per_m3: ArrayLike) -> ArrayLike:
     """
     Convert information density to mass density.
     
@@ -186,13 +211,19 @@ def information_density_to_mass_density(info_bits_per_m3: float) -> float:
     Returns:
         Mass density in kg/m³
     """
-    return info_bits_per_m3 * VOPSON_CONSTANT
+    return np.multiply(info_bits_per_m3, VOPSON_CONSTANT)
+
+
+@njit(fastmath=True, cache=True, error_model='numpy')
+def _entropy_gradient_force(entropy_gradient, temperature):
+    """Entropic force k_B T dS/dx, compiled for any shape and dtype."""
+    return temperature * K_B * entropy_gradient
 
 
 def emergent_force_from_entropy_gradient(
-    entropy_gradient: float,
-    temperature: float = 300.0
-) -> float:
+    entropy_gradient: ArrayLike,
+    temperature: ArrayLike = 300.0
+) -> ArrayLike:
     """
     Calculate emergent force from entropy gradient (Verlinde).
     
@@ -212,10 +243,10 @@ def emergent_force_from_entropy_gradient(
         - Verlinde, E. (2011). On the origin of gravity
         - Slade, T. & Vetro, G.: Informational force framework
     """
-    return temperature * K_B * entropy_gradient
+    return _entropy_gradient_force(np.asarray(entropy_gradient), np.asarray(temperature))
 
 
-def mass_defect_information(binding_energy: float) -> Tuple[float, float]:
+def mass_defect_information(binding_energy: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
     """
     Calculate mass defect and corresponding information content.
     
@@ -229,38 +260,56 @@ def mass_defect_information(binding_energy: float) -> Tuple[float, float]:
         Tuple of (mass defect in kg, equivalent information in bits)
     """
     mass_defect = mass_from_energy(binding_energy)
-    equivalent_bits = mass_defect / VOPSON_CONSTANT
+    equivalent_bits = np.true_divide(mass_defect, VOPSON_CONSTANT)
     
     return mass_defect, equivalent_bits
 
 
 if __name__ == "__main__":
-    print("=" * 70)
-    print("Mass-Energy-Information Equivalence Demonstrations")
-    print("Framework by Trent Slade & Gary Vetro")
-    print("Based on Melvin Vopson & Erik Verlinde's principles")
-    print("=" * 70)
+    import argparse
+    import io
+    import sys
+    
+    parser = argparse.ArgumentParser(
+        description="Mass-energy-information equivalence demonstrations")
+    parser.add_argument("--quiet", action="store_true",
+                        help="run the calculations without formatting or printing")
+    args = parser.parse_args()
     
     # Example 1: Information mass
-    print("\n1. Information Mass (Vopson):")
     bits = 1e20
     mass = information_mass(bits)
-    print(f"   {bits:.2e} bits = {mass:.6e} kg")
     
     # Example 2: Landauer energy
-    print("\n2. Landauer's Principle:")
     energy = landauer_energy(1000, 300)
     equiv_mass = mass_from_energy(energy)
-    print(f"   Erasing 1000 bits at 300K: {energy:.6e} J")
-    print(f"   Equivalent mass: {equiv_mass:.6e} kg")
     
     # Example 3: Black hole entropy
-    print("\n3. Black Hole Information:")
     solar_mass = 1.989e30  # kg
     entropy = schwarzschild_information_entropy(solar_mass)
-    print(f"   Solar mass black hole entropy: {entropy:.6e} k_B")
     
     # Example 4: Emergent force
-    print("\n4. Verlinde's Emergent Force:")
     force = emergent_force_from_entropy_gradient(1e10, 300)
-    print(f"   Force from entropy gradient: {force:.6e} N")
+    
+    # The report is built in a buffer and written with a single call
+    if not args.quiet:
+        out = io.StringIO()
+        print("=" * 70, file=out)
+        print("Mass-Energy-Information Equivalence Demonstrations", file=out)
+        print("Framework by Trent Slade & Gary Vetro", file=out)
+        print("Based on Melvin Vopson & Erik Verlinde's principles", file=out)
+        print("=" * 70, file=out)
+        
+        print("\n1. Information Mass (Vopson):", file=out)
+        print(f"   {bits:.2e} bits = {mass:.6e} kg", file=out)
+        
+        print("\n2. Landauer's Principle:", file=out)
+        print(f"   Erasing 1000 bits at 300K: {energy:.6e} J", file=out)
+        print(f"   Equivalent mass: {equiv_mass:.6e} kg", file=out)
+        
+        print("\n3. Black Hole Information:", file=out)
+        print(f"   Solar mass black hole entropy: {entropy:.6e} k_B", file=out)
+        
+        print("\n4. Verlinde's Emergent Force:", file=out)
+        print(f"   Force from entropy gradient: {force:.6e} N", file=out)
+        sys.stdout.write(out.getvalue())
@@ -29,6 +29,8 @@ Ethics: This code is intended for theoretical exploration and education.
 """
 import numpy as np
 
+from _jit import NUMBA_AVAILABLE, njit, prange
+
 def encode_qutrit(data):
     """
     Encode a single trit as a repetition code.
@@ -63,7 +65,8 @@ def introduce_error(codeword, pos, error_trit):
         error_trit: New trit value (0, 1, or 2) after error
        
     Returns:
-        Corrupted codeword with error at specified position
+        Corrupted copy of the codeword with error at specified position;
+        see introduce_error_inplace for the allocation-free variant
        
     Example:
         >>> introduce_error([1, 1, 1], 0, 2)
@@ -73,14 +76,45 @@ def introduce_error(codeword, pos, error_trit):
     codeword[pos] = error_trit
     return codeword
 
+def introduce_error_inplace(codeword, pos, error_trit):
+    """
+    Introduce a trit-flip error at position pos, mutating the codeword.
+   
+    Same as introduce_error without the defensive copy, for sampling loops
+    that reuse one scratch buffer across trials instead of allocating a
+    new codeword each time:
+   
+        cw = np.empty(3, dtype=np.int8)
+        for ...:
+            cw[:] = data
+            introduce_error_inplace(cw, pos, error_trit)
+   
+    Args:
+        codeword: Mutable sequence (list or array) holding the encoded state
+        pos: Position (0, 1, or 2) where error occurs
+        error_trit: New trit value (0, 1, or 2) after error
+       
+    Returns:
+        The same codeword object, now corrupted
+       
+    Example:
+        >>> cw = [1, 1, 1]
+        >>> introduce_error_inplace(cw, 0, 2) is cw
+        True
+    """
+    codeword[pos] = error_trit
+    return codeword
+
 def decode_qutrit(codeword):
     """
     Decode using majority vote (trit).
    
     Uses majority voting to recover the original trit value from the
-    redundantly encoded state. For qutrits, we use numpy's bincount
-    to count occurrences of each trit value (0, 1, 2) and return the
-    most frequent one.
+    redundantly encoded state. For the length-3 repetition code the
+    vote is a pair of equality checks on plain ints; other lengths count
+    occurrences with numpy's bincount and return the most frequent value.
+    When all three trits differ, the smallest one is returned, matching
+    bincount's tie-break.
    
     This demonstrates that single-error correction is possible with
     a 3-qutrit repetition code.
@@ -97,8 +131,111 @@ def decode_qutrit(codeword):
         >>> decode_qutrit([0, 0, 0]) # No errors
         0
     """
-    counts = np.bincount(codeword, minlength=3)
-    return np.argmax(counts)
+    if len(codeword) != 3:
+        counts = np.bincount(codeword, minlength=3)
+        return np.argmax(counts)
+    a, b, c = codeword
+    if a == b or a == c:
+        return a
+    if b == c:
+        return b
+    return min(a, b, c)
+
+def decode_qutrit_batch(codewords):
+    """
+    Decode many length-3 codewords at once by majority vote.
+   
+    The three codeword positions are treated as columns and voted on with
+    elementwise comparisons and np.where, so the whole batch is decoded in
+    a handful of vectorized passes; with Numba installed, int8 input goes
+    through a compiled kernel that decodes each row in a single pass,
+    fully unrolled for the fixed length of 3. Results match decode_qutrit row by row,
+    including the smallest-trit tie-break for all-distinct codewords.
+   
+    Args:
+        codewords: (N, 3) array of trits; a C-contiguous np.int8 array
+            avoids any conversion
+       
+    Returns:
+        (N,) np.int8 array of decoded trits
+       
+    Raises:
+        ValueError: If codewords is not an (N, 3) array
+       
+    Example:
+        >>> decode_qutrit_batch(np.array([[1, 1, 2], [0, 2, 2]], dtype=np.int8))
+        array([1, 2], dtype=int8)
+    """
+    codewords = np.asarray(codewords)
+    # The compiled kernel reads columns 0-2 without bounds checks
+    if codewords.ndim != 2 or codewords.shape[1] != 3:
+        raise ValueError(f"codewords must have shape (N, 3), got {codewords.shape}")
+    if NUMBA_AVAILABLE and codewords.dtype == np.int8:
+        return _decode_batch_kernel(codewords)
+    c0, c1, c2 = codewords[:, 0], codewords[:, 1], codewords[:, 2]
+    tie = np.minimum(np.minimum(c0, c1), c2)
+    decoded = np.where((c0 == c1) | (c0 == c2), c0, np.where(c1 == c2, c1, tie))
+    return decoded.astype(np.int8, copy=False)
+
+@njit(cache=True)
+def _majority3(a, b, c):
+    """Majority of three trits; the smallest one when all differ."""
+    if a == b or a == c:
+        return a
+    if b == c:
+        return b
+    return min(a, b, c)
+
+@njit('int8[:](int8[:, :])', cache=True)
+def _decode_batch_kernel(codewords):
+    """Compiled decode_qutrit_batch for int8 input, one pass over the rows."""
+    n = codewords.shape[0]
+    decoded = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        decoded[i] = _majority3(codewords[i, 0], codewords[i, 1], codewords[i, 2])
+    return decoded
+
+@njit(parallel=True, cache=True)
+def mc_qec_trials(n_trials, p_error, seed):
+    """
+    Monte-Carlo estimate of the repetition code's logical error count.
+   
+    Each trial draws a random trit, encodes it, independently flips each
+    of the three qutrits with probability p_error to one of the two other
+    trit values, and decodes by majority vote. Encode, error and decode are
+    fused into one compiled loop, parallel over trials when Numba is
+    installed.
+   
+    Args:
+        n_trials: Number of trials
+        p_error: Per-qutrit error probability (0 to 1)
+        seed: Seed for NumPy's global random generator
+       
+    Returns:
+        Number of trials whose decoded trit differs from the original
+       
+    Note:
+        Under Numba each worker thread has its own random stream and the
+        seed only fixes the calling thread's, so parallel runs are not
+        bit-for-bit reproducible. Divide by n_trials for the logical
+        error rate.
+    """
+    np.random.seed(seed)
+    errors = 0
+    for i in prange(n_trials):
+        data = np.random.randint(0, 3)
+        a = data
+        b = data
+        c = data
+        if np.random.random() < p_error:
+            a = (data + np.random.randint(1, 3)) % 3
+        if np.random.random() < p_error:
+            b = (data + np.random.randint(1, 3)) % 3
+        if np.random.random() < p_error:
+            c = (data + np.random.randint(1, 3)) % 3
+        if _majority3(a, b, c) != data:
+            errors += 1
+    return errors
 
 def test_qec_no_error():
     """
@@ -129,6 +266,65 @@ def test_qec_with_error():
         corrupted = introduce_error(encoded, 0, error_trit)
         decoded = decode_qutrit(corrupted)
         assert decoded == data, f"Error: decoded={decoded} != original={data} (corrupted={corrupted})"
+   
+    # Same sweep through one reused scratch buffer
+    cw = np.empty(3, dtype=np.int8)
+    for pos in range(3):
+        for error_trit in [0, 2]:
+            cw[:] = data
+            corrupted = introduce_error_inplace(cw, pos, error_trit)
+            assert corrupted is cw
+            assert decode_qutrit(cw) == data, f"Error: corrupted={cw}"
+
+def test_decode_qutrit_matches_bincount():
+    """
+    Test the length-3 majority vote against the generic bincount decoder.
+   
+    Checks all 27 possible three-trit codewords, including the
+    undecodable all-distinct ones.
+    """
+    for a in range(3):
+        for b in range(3):
+            for c in range(3):
+                codeword = [a, b, c]
+                expected = np.argmax(np.bincount(codeword, minlength=3))
+                assert decode_qutrit(codeword) == expected, f"codeword={codeword}"
+
+def test_decode_qutrit_batch():
+    """
+    Test the batched decoder against decode_qutrit on every codeword.
+    """
+    codewords = np.array([[a, b, c] for a in range(3) for b in range(3) for c in range(3)],
+                         dtype=np.int8)
+    decoded = decode_qutrit_batch(codewords)
+    assert decoded.dtype == np.int8
+    for codeword, trit in zip(codewords.tolist(), decoded):
+        assert trit == decode_qutrit(codeword), f"codeword={codeword}"
+
+def test_decode_qutrit_batch_rejects_bad_shape():
+    """
+    Test that the batched decoder refuses anything but (N, 3) codewords.
+   
+    Without the check, the compiled int8 kernel would read past the end of
+    each row of an (N, 2) array.
+    """
+    for shape in [(4, 2), (4, 4), (3,), (2, 3, 3)]:
+        try:
+            decode_qutrit_batch(np.zeros(shape, dtype=np.int8))
+        except ValueError:
+            continue
+        raise AssertionError(f"shape {shape} was accepted")
+
+def test_mc_qec_trials():
+    """
+    Test the Monte-Carlo harness at the noiseless and single-error limits.
+   
+    With p_error = 0 no trial can fail; with p_error = 1 every qutrit is
+    corrupted, so some trials must fail.
+    """
+    assert mc_qec_trials(1000, 0.0, 0) == 0
+    errors = mc_qec_trials(1000, 1.0, 0)
+    assert 0 < errors <= 1000
 
 def run_qec_demonstration():
     """
@@ -172,23 +368,18 @@ def run_qec_demonstration():
     print("\n3. Statistical Analysis")
     print("-" * 40)
    
-    # Test all single-error scenarios
-    success_count = 0
-    total_tests = 0
-   
-    for data in [0, 1, 2]:
-        for error_pos in [0, 1, 2]:
-            for error_trit in [0, 1, 2]:
-                if error_trit == data:
-                    continue # Not an error
-               
-                total_tests += 1
-                encoded = encode_qutrit(data)
-                corrupted = introduce_error(encoded, error_pos, error_trit)
-                decoded = decode_qutrit(corrupted)
-               
-                if decoded == data:
-                    success_count += 1
+    # Test all single-error scenarios at once: axes are
+    # (data, error_pos, error_trit, codeword position)
+    trits = np.arange(3)
+    codewords = np.broadcast_to(trits[:, None, None, None], (3, 3, 3, 3)).copy()
+    codewords[:, trits, :, trits] = trits
+    counts = (codewords[..., None] == trits).sum(axis=-2)
+    decoded = counts.argmax(axis=-1)
+    mask = trits[None, None, :] != trits[:, None, None]  # error_trit == data is not an error
+    mask = np.broadcast_to(mask, decoded.shape)
+   
+    total_tests = int(mask.sum())
+    success_count = int(((decoded == trits[:, None, None]) & mask).sum())
    
     success_rate = (success_count / total_tests) * 100
     print(f" Total single-error tests: {total_tests}")
@@ -16,12 +16,23 @@ Ethics: This code is intended for theoretical exploration and education.
         Users must consider implications of quantum information research.
 """
 
+import functools
+
 import numpy as np
 from typing import Tuple, Optional
 import warnings
 
 
-def von_neumann_entropy(density_matrix: np.ndarray) -> float:
+# Hermiticity check in von_neumann_entropy; off in the hot path, enable
+# when feeding matrices of unknown provenance
+_CHECK_HERMITIAN = False
+# Largest matrix (in elements) whose entropy is memoized; bigger inputs go
+# straight to eigvalsh so the cache never holds copies of large matrices
+_ENTROPY_CACHE_MAX_SIZE = 64 * 64
+
+
+def von_neumann_entropy(density_matrix: np.ndarray,
+                        check_hermitian: Optional[bool] = None) -> float:
     """
     Calculate the von Neumann entropy of a quantum state.
     
@@ -32,29 +43,62 @@ def von_neumann_entropy(density_matrix: np.ndarray) -> float:
     
     Args:
         density_matrix: Density matrix representation of quantum state
+        check_hermitian: Symmetrize (with a warning) non-Hermitian input;
+            defaults to the module-level _CHECK_HERMITIAN flag
         
     Returns:
         Von Neumann entropy in bits
         
+    Note:
+        Without the check only the lower triangle of the matrix is read,
+        so a non-Hermitian input is silently treated as its Hermitian
+        completion.
+        
     References:
         - Vopson, M. M. (2019). The mass-energy-information equivalence principle
         - Verlinde, E. (2011). On the origin of gravity and the laws of Newton
     """
+    if check_hermitian is None:
+        check_hermitian = _CHECK_HERMITIAN
+    
     # Ensure hermitian
-    if not np.allclose(density_matrix, density_matrix.conj().T):
+    if check_hermitian and not np.allclose(density_matrix, density_matrix.conj().T):
         warnings.warn("Density matrix is not Hermitian, symmetrizing...")
         density_matrix = (density_matrix + density_matrix.conj().T) / 2
     
-    # Get eigenvalues
-    eigenvalues = np.linalg.eigvalsh(density_matrix)
-    
-    # Filter out zero/negative eigenvalues (numerical errors)
-    eigenvalues = eigenvalues[eigenvalues > 1e-12]
+    if np.size(density_matrix) > _ENTROPY_CACHE_MAX_SIZE:
+        return _entropy_from_eigs(np.linalg.eigvalsh(density_matrix))
+    density_matrix = np.ascontiguousarray(density_matrix)
+    return _entropy_cached(density_matrix.tobytes(), density_matrix.shape,
+                           density_matrix.dtype.str)
+
+
+def _entropy_from_eigs(eigenvalues: np.ndarray) -> float:
+    """
+    Shannon entropy in bits of a spectrum, with 0·log 0 = 0.
     
-    # Calculate entropy
-    entropy = -np.sum(eigenvalues * np.log2(eigenvalues))
+    Round-off negatives are clipped to zero and the logarithm is only
+    evaluated where the eigenvalue is positive, so no filtered copy of
+    the spectrum is made.
+    """
+    w = np.clip(eigenvalues, 0, None)
+    log_w = np.log2(w, out=np.zeros_like(w), where=w > 0)
+    return -np.dot(w, log_w)
+
+
+@functools.lru_cache(maxsize=128)
+def _entropy_cached(data: bytes, shape: Tuple[int, ...], dtype: str) -> float:
+    """
+    Von Neumann entropy memoized on the density matrix's raw contents.
     
-    return entropy
+    Workflows such as quantum_mutual_information evaluate the entropy of
+    the same small matrices repeatedly; keying on the bytes skips the
+    repeated eigendecomposition. The cache is process-wide and holds a
+    copy of each key's bytes, so von_neumann_entropy only routes matrices
+    of at most _ENTROPY_CACHE_MAX_SIZE elements through it.
+    """
+    density_matrix = np.frombuffer(data, dtype=dtype).reshape(shape)
+    return _entropy_from_eigs(np.linalg.eigvalsh(density_matrix))
 
 
 def quantum_mutual_information(rho_AB: np.ndarray, 
@@ -110,11 +154,11 @@ def partial_trace(rho: np.ndarray,
     rho_reshaped = rho.reshape(dim_A, dim_B, dim_A, dim_B)
     
     if trace_over == 'B':
-        # Trace over B
-        rho_reduced = np.trace(rho_reshaped, axis1=1, axis2=3)
+        # Trace over B: contract the two B indices
+        rho_reduced = np.einsum('ijkj->ik', rho_reshaped)
     else:
-        # Trace over A
-        rho_reduced = np.trace(rho_reshaped, axis1=0, axis2=2)
+        # Trace over A: contract the two A indices
+        rho_reduced = np.einsum('ijil->jl', rho_reshaped)
     
     return rho_reduced
 
@@ -160,12 +204,15 @@ def quantum_fidelity(rho: np.ndarray, sigma: np.ndarray) -> float:
     Returns:
         Fidelity value between 0 and 1
     """
-    sqrt_rho = np.linalg.matrix_power(rho, 0.5)
+    # √ρ from one Hermitian eigendecomposition; clip round-off negatives
+    w, V = np.linalg.eigh(rho)
+    sqrt_rho = (V * np.sqrt(np.clip(w, 0, None))) @ V.conj().T
     M = sqrt_rho @ sigma @ sqrt_rho
-    sqrt_M = np.linalg.matrix_power(M, 0.5)
-    fidelity = np.trace(sqrt_M) ** 2
     
-    return np.real(fidelity)
+    # Tr √M is the sum of √eigenvalues; no eigenvectors needed
+    fidelity = np.sum(np.sqrt(np.clip(np.linalg.eigvalsh(M), 0, None))) ** 2
+    
+    return fidelity
 
 
 def create_bell_state(which: int = 0) -> np.ndarray:
@@ -184,23 +231,30 @@ def create_bell_state(which: int = 0) -> np.ndarray:
             
     Returns:
         4x4 density matrix of Bell state
+        
+    Note:
+        The matrices are built once and shared between calls, so the
+        returned array is read-only; use ``.copy()`` to modify it.
     """
-    # State vectors
-    if which == 0:
-        psi = np.array([1, 0, 0, 1]) / np.sqrt(2)
-    elif which == 1:
-        psi = np.array([1, 0, 0, -1]) / np.sqrt(2)
-    elif which == 2:
-        psi = np.array([0, 1, 1, 0]) / np.sqrt(2)
-    else:
-        psi = np.array([0, 1, -1, 0]) / np.sqrt(2)
-    
-    # Density matrix
+    return _BELL[which if which in (0, 1, 2) else 3]
+
+
+def _frozen_density_matrix(psi: np.ndarray) -> np.ndarray:
+    """Read-only density matrix |ψ⟩⟨ψ| of a pure state."""
     rho = np.outer(psi, psi.conj())
-    
+    rho.flags.writeable = False
     return rho
 
 
+# Bell state density matrices, indexed as in create_bell_state
+_BELL = tuple(_frozen_density_matrix(np.array(v) / np.sqrt(2)) for v in (
+    [1, 0, 0, 1],
+    [1, 0, 0, -1],
+    [0, 1, 1, 0],
+    [0, 1, -1, 0],
+))
+
+
 if __name__ == "__main__":
     # Demonstration of quantum information measures
     print("=" * 70)
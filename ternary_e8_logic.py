@@ -21,6 +21,9 @@ from typing import List, Tuple, Optional, Union
 from enum import Enum
 
 
+_INV_LOG3 = 1.0 / np.log(3)
+
+
 class TernaryValue(Enum):
     """Ternary logic values: FALSE (-1), UNKNOWN (0), TRUE (1)"""
     FALSE = -1
@@ -41,64 +44,64 @@ class TernaryLogic:
     """
     
     @staticmethod
-    def ternary_and(a: int, b: int) -> int:
+    def ternary_and(a: Union[int, np.ndarray],
+                    b: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
         """
         Ternary AND operation (Kleene logic).
         
+        With FALSE < UNKNOWN < TRUE, AND is the minimum of its operands,
+        so whole arrays of ternary values are combined elementwise.
+        
         Args:
-            a, b: Values in {-1, 0, 1}
+            a, b: Values in {-1, 0, 1} (scalars or arrays)
             
         Returns:
             Result in {-1, 0, 1}
         """
-        if a == -1 or b == -1:
-            return -1
-        if a == 0 or b == 0:
-            return 0
-        return 1
+        return np.minimum(a, b)
     
     @staticmethod
-    def ternary_or(a: int, b: int) -> int:
+    def ternary_or(a: Union[int, np.ndarray],
+                   b: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
         """
         Ternary OR operation (Kleene logic).
         
+        OR is the maximum of its operands.
+        
         Args:
-            a, b: Values in {-1, 0, 1}
+            a, b: Values in {-1, 0, 1} (scalars or arrays)
             
         Returns:
             Result in {-1, 0, 1}
         """
-        if a == 1 or b == 1:
-            return 1
-        if a == 0 or b == 0:
-            return 0
-        return -1
+        return np.maximum(a, b)
     
     @staticmethod
-    def ternary_not(a: int) -> int:
+    def ternary_not(a: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
         """
         Ternary NOT operation.
         
         Args:
-            a: Value in {-1, 0, 1}
+            a: Value in {-1, 0, 1} (scalar or array)
             
         Returns:
             Result in {-1, 0, 1}
         """
-        return -a
+        return np.negative(a)
     
     @staticmethod
-    def ternary_implication(a: int, b: int) -> int:
+    def ternary_implication(a: Union[int, np.ndarray],
+                            b: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
         """
-        Ternary implication: a → b.
+        Ternary implication: a → b, i.e. max(¬a, b).
         
         Args:
-            a, b: Values in {-1, 0, 1}
+            a, b: Values in {-1, 0, 1} (scalars or arrays)
             
         Returns:
             Result in {-1, 0, 1}
         """
-        return TernaryLogic.ternary_or(TernaryLogic.ternary_not(a), b)
+        return np.maximum(np.negative(a), b)
 
 
 def e8_root_system() -> np.ndarray:
@@ -110,7 +113,7 @@ def e8_root_system() -> np.ndarray:
     (Lisi's E8 theory, string theory).
     
     Returns:
-        240x8 array of E8 roots
+        240x8 array of E8 roots (shared and read-only; copy to modify)
         
     References:
         - Lie, S. & Cartan, É.: Classification of simple Lie algebras
@@ -120,25 +123,33 @@ def e8_root_system() -> np.ndarray:
     Note: Connection to Slade-Vetro framework through information geometry
           and Verlinde's emergent spacetime structure.
     """
-    roots = []
-    
-    # Type 1: 112 roots (all permutations and sign changes)
-    for i in range(8):
-        for j in range(i + 1, 8):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    root = np.zeros(8)
-                    root[i] = si
-                    root[j] = sj
-                    roots.append(root)
-    
-    # Type 2: 128 roots (all even number of minus signs)
-    for signs in range(256):
-        root = np.array([(1 if (signs >> i) & 1 else -1) / 2 for i in range(8)])
-        if np.sum(root) % 2 == 0:  # Even number of minus signs
-            roots.append(root)
-    
-    return np.array(roots)
+    return _E8_ROOTS
+
+
+def _build_e8_roots() -> np.ndarray:
+    """Construct the 240 E8 roots once, for _E8_ROOTS."""
+    # Type 1: 112 roots (all permutations and sign changes): ±1 at each
+    # of the 28 coordinate pairs i < j, for each of the 4 sign choices
+    i, j = np.triu_indices(8, k=1)
+    si, sj = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]]).T
+    pair, sign = np.arange(28)[:, None], np.arange(4)
+    type1 = np.zeros((28, 4, 8))
+    type1[pair, sign, i[:, None]] = si
+    type1[pair, sign, j[:, None]] = sj
+    
+    # Type 2: 128 roots (all even number of minus signs); bit i of each
+    # byte 0..255 selects the sign of coordinate i
+    bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1,
+                         bitorder='little')
+    half_roots = bits - 0.5
+    type2 = half_roots[half_roots.sum(axis=1) % 2 == 0]  # Even number of minus signs
+    
+    roots = np.concatenate([type1.reshape(112, 8), type2])
+    roots.flags.writeable = False
+    return roots
+
+
+_E8_ROOTS = _build_e8_roots()
 
 
 def e8_dimension() -> int:
@@ -146,28 +157,35 @@ def e8_dimension() -> int:
     return 248
 
 
-def e8_cartan_matrix() -> np.ndarray:
+# E8 Cartan matrix (Dynkin diagram based)
+_E8_CARTAN = np.array([
+    [ 2, -1,  0,  0,  0,  0,  0,  0],
+    [-1,  2, -1,  0,  0,  0,  0,  0],
+    [ 0, -1,  2, -1,  0,  0,  0, -1],
+    [ 0,  0, -1,  2, -1,  0,  0,  0],
+    [ 0,  0,  0, -1,  2, -1,  0,  0],
+    [ 0,  0,  0,  0, -1,  2, -1,  0],
+    [ 0,  0,  0,  0,  0, -1,  2,  0],
+    [ 0,  0, -1,  0,  0,  0,  0,  2]
+], dtype=np.int8)
+_E8_CARTAN.flags.writeable = False
+
+
+def e8_cartan_matrix(copy: bool = True) -> np.ndarray:
     """
     Generate the Cartan matrix for E8.
     
     The Cartan matrix encodes the structure of the E8 root system,
     fundamental to understanding symmetries in theoretical physics.
     
+    Args:
+        copy: Return a fresh writable copy; pass False to get the shared
+            read-only module constant without allocating
+    
     Returns:
-        8x8 Cartan matrix
+        8x8 Cartan matrix (int8)
     """
-    # E8 Cartan matrix (Dynkin diagram based)
-    cartan = np.array([
-        [ 2, -1,  0,  0,  0,  0,  0,  0],
-        [-1,  2, -1,  0,  0,  0,  0,  0],
-        [ 0, -1,  2, -1,  0,  0,  0, -1],
-        [ 0,  0, -1,  2, -1,  0,  0,  0],
-        [ 0,  0,  0, -1,  2, -1,  0,  0],
-        [ 0,  0,  0,  0, -1,  2, -1,  0],
-        [ 0,  0,  0,  0,  0, -1,  2,  0],
-        [ 0,  0, -1,  0,  0,  0,  0,  2]
-    ])
-    return cartan
+    return _E8_CARTAN.copy() if copy else _E8_CARTAN
 
 
 def ternary_to_quantum_state(ternary_values: List[int]) -> np.ndarray:
@@ -186,35 +204,38 @@ def ternary_to_quantum_state(ternary_values: List[int]) -> np.ndarray:
     Note: This mapping is exploratory, connecting discrete logic to
           continuous quantum states (Slade-Vetro framework).
     """
-    # Map: -1 → |0⟩, 0 → (|0⟩+|1⟩)/√2, 1 → |1⟩
-    dim = 2 ** len(ternary_values)
-    state = np.zeros(dim, dtype=complex)
-    
-    for i, val in enumerate(ternary_values):
-        if val == -1:
-            # Contribute to |0⟩ states
-            pass
-        elif val == 1:
-            # Contribute to |1⟩ states
-            pass
-        else:
-            # Equal superposition
-            pass
-    
-    # Simplified mapping: encode as qutrit-like structure
+    # Qutrit encoding: the values select a single computational basis
+    # state |k⟩ of the 3ⁿ-dimensional space, already normalized
     n = len(ternary_values)
     state = np.zeros(3 ** n, dtype=complex)
+    state[ternary_basis_index(ternary_values)] = 1.0
     
-    for i, val in enumerate(ternary_values):
-        idx = (val + 1)  # Map {-1,0,1} to {0,1,2}
-        state[idx + i * 3] = 1.0
+    return state
+
+
+def ternary_basis_index(ternary_values: List[int]) -> int:
+    """
+    Index of the qutrit basis state selected by a ternary sequence.
     
-    # Normalize
-    norm = np.linalg.norm(state)
-    if norm > 0:
-        state = state / norm
+    Each value maps to a trit via {-1, 0, 1} → {0, 1, 2}, and the
+    sequence is read as a base-3 number with the first value as the most
+    significant digit. For long sequences, where the dense 3ⁿ vector from
+    ternary_to_quantum_state is impractical, this index is the whole state.
     
-    return state
+    Args:
+        ternary_values: List of ternary values in {-1, 0, 1}
+        
+    Returns:
+        Basis index k in [0, 3ⁿ)
+        
+    Example:
+        >>> ternary_basis_index([1, -1])  # trits (2, 0) → 2·3 + 0
+        6
+    """
+    k = 0
+    for val in ternary_values:
+        k = 3 * k + (int(val) + 1)
+    return k
 
 
 def e8_lattice_vector_norm_squared(vector: np.ndarray) -> float:
@@ -260,7 +281,7 @@ def ternary_entropy(probabilities: np.ndarray) -> float:
     binary entropy to three-valued logic.
     
     Args:
-        probabilities: Array of 3 probabilities summing to 1
+        probabilities: Array of probabilities summing to 1 (any shape)
         
     Returns:
         Entropy in trits (ternary digits)
@@ -269,9 +290,10 @@ def ternary_entropy(probabilities: np.ndarray) -> float:
         - Shannon, C. E. (1948). A mathematical theory of communication
         - Extension to ternary by Slade-Vetro framework
     """
-    # Filter out zero probabilities
-    p = probabilities[probabilities > 0]
-    entropy = -np.sum(p * np.log(p) / np.log(3))
+    # 0·log 0 = 0: take the log only where p > 0, without a filtered copy
+    p = np.asarray(probabilities, dtype=float)
+    log_p = np.log(p, out=np.zeros_like(p), where=p > 0)
+    entropy = -np.sum(p * log_p) * _INV_LOG3
     return entropy
 
 
@@ -294,7 +316,7 @@ def ternary_mutual_information(joint_prob: np.ndarray) -> float:
     # Entropies
     H_x = ternary_entropy(p_x)
     H_y = ternary_entropy(p_y)
-    H_xy = ternary_entropy(joint_prob.flatten())
+    H_xy = ternary_entropy(joint_prob)
     
     return H_x + H_y - H_xy
 
@@ -324,4 +346,4 @@ if __name__ == "__main__":
     probs = np.array([0.5, 0.3, 0.2])
     entropy = ternary_entropy(probs)
     print(f"   Entropy of {probs}: {entropy:.4f} trits")
-    print(f"   Maximum ternary entropy: {np.log(3)/np.log(3):.4f} trits")
+    print(f"   Maximum ternary entropy: {ternary_entropy(np.full(3, 1.0 / 3)):.4f} trits")
